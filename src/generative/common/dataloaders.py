@@ -45,9 +45,13 @@ def add_channel_dim(dataset: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
 def normalise(
     normalisation: str,
     dataset: npt.NDArray[np.uint8],
-) -> npt.NDArray[np.float64]:
+) -> npt.NDArray[np.float32]:
     """Normalise images to either [0, 1] or [-1, 1].
 
+    Notes:
+    -----
+        - Uses float32 and in-place operations to avoid temporary copies
+
     Args:
     ----
         normalisation: either `01` or `-11`
@@ -55,17 +59,20 @@ def normalise(
 
     Returns:
     -------
-        dataset: float64 NDArray
+        dataset: float32 NDArray
 
     """
-    # Normalise to [0, 1]
-    min_val, max_val = dataset.min(), dataset.max()
-    dataset_float = dataset.astype(np.float64)
-    dataset_float = (dataset_float - min_val) / (max_val - min_val + EPSILON)
+    min_val, max_val = float(dataset.min()), float(dataset.max())
+    scale = 1.0 / (max_val - min_val + EPSILON)
+    dataset_float = dataset.astype(np.float32)
+    dataset_float -= min_val
 
-    # Normalise to [-1, 1] if needed
+    # Normalise to [0, 1] or [-1, 1]
     if normalisation == Normalisation.NEG_ONE_ONE:
-        dataset_float = (dataset_float * 2) - 1
+        dataset_float *= 2 * scale
+        dataset_float -= 1
+    else:
+        dataset_float *= scale
 
     return dataset_float
 
@@ -123,22 +130,17 @@ def resize_dataset(img_dims: list[int], dataset: tf.Tensor) -> tf.Tensor:
     return tf.cast(dataset, tf.float32)
 
 
-def get_dataset_from_file(
-    cfg: DictConfig,
-    split: str,
-    n_critic: int = 1,
-) -> tf.data.Dataset:
-    """Get dataset from a single file.
+def load_dataset_file(cfg: DictConfig, split: str) -> npt.NDArray[np.uint8]:
+    """Load images from either .npy (memory-mapped) or .npz file.
 
     Args:
     ----
         cfg: config
         split: one of `train`, `valid` or `test`
-        n_critic: number of dicsriminator iterations (set to 1 if not Wasserstein GAN)
 
     Returns:
     -------
-        dataset: tf.data.Dataset
+        dataset: uint8 NDArray
 
     """
     # Get data directory
@@ -147,20 +149,54 @@ def get_dataset_from_file(
     else:
         data_path = Path(cfg.data_dir)
 
-    # Load dataset from .npz
+    # Memory-map dataset from .npy if available, otherwise load from .npz
+    dataset_np: npt.NDArray[np.uint8]
+
     try:
-        data_path = data_path / f"{cfg.dataset_name}.npz"
-        dataset_np = np.load(data_path)[f"x_{split}"]
+        if (data_path / f"x_{split}.npy").exists():
+            data_path = data_path / f"x_{split}.npy"
+            dataset_np = np.load(data_path, mmap_mode="r")
+        else:
+            data_path = data_path / f"{cfg.dataset_name}.npz"
+            dataset_np = np.load(data_path)[f"x_{split}"]
     except FileNotFoundError:
         logger.exception("File not found at %s", data_path)
         sys.exit(1)
 
+    return dataset_np
+
+
+def get_dataset_from_file(
+    cfg: DictConfig,
+    split: str,
+    n_critic: int = 1,
+    data_array: npt.NDArray[np.uint8] | None = None,
+) -> tf.data.Dataset:
+    """Get dataset from a single file.
+
+    Args:
+    ----
+        cfg: config
+        split: one of `train`, `valid` or `test`
+        n_critic: number of dicsriminator iterations (set to 1 if not Wasserstein GAN)
+        data_array: already loaded images (if None, loads from file)
+
+    Returns:
+    -------
+        dataset: tf.data.Dataset
+
+    """
+    if data_array is not None:
+        dataset_np = data_array
+    else:
+        dataset_np = load_dataset_file(cfg, split)
+
     # Add channel dimension if needed
     dataset_np = add_channel_dim(dataset_np)
 
     # Normalise and convert to tensor
-    dataset_np = normalise(cfg.normalisation, dataset_np)
-    dataset_tf = tf.convert_to_tensor(dataset_np)
+    dataset_float = normalise(cfg.normalisation, dataset_np)
+    dataset_tf = tf.convert_to_tensor(dataset_float)
 
     # Resize dataset if needed
     dataset_tf = resize_dataset(cfg.img_dims, dataset_tf)
@@ -170,7 +206,11 @@ def get_dataset_from_file(
 
     dataset = tf.data.Dataset.from_tensor_slices(dataset_tf)
 
-    return dataset.shuffle(dataset_size).batch(cfg.batch_size * n_critic)
+    # Drop incomplete final batch so critic minibatches are always full
+    return dataset.shuffle(dataset_size).batch(
+        cfg.batch_size * n_critic,
+        drop_remainder=True,
+    )
 
 
 def get_dataset_from_folder(cfg: DictConfig, n_critic: int = 1) -> tf.data.Dataset:
@@ -195,12 +235,12 @@ def get_dataset_from_folder(cfg: DictConfig, n_critic: int = 1) -> tf.data.Datas
 
     normalisation_fn = partial(normalise_tf, cfg.normalisation)
 
-    # Load dataset from folder
+    # Load dataset from folder (batched below to drop incomplete final batch)
     dataset = tf.keras.utils.image_dataset_from_directory(
         data_dir,
         labels=None,
         color_mode="rgb",
-        batch_size=cfg.batch_size * n_critic,
+        batch_size=None,
         image_size=tuple(cfg.img_dims),
         shuffle=True,
         seed=None,
@@ -209,7 +249,8 @@ def get_dataset_from_folder(cfg: DictConfig, n_critic: int = 1) -> tf.data.Datas
         verbose=True,
     )
 
-    cfg.img_dims = tf.shape(next(iter(dataset))).numpy().tolist()[1:]
+    cfg.img_dims = tf.shape(next(iter(dataset))).numpy().tolist()
+    dataset = dataset.batch(cfg.batch_size * n_critic, drop_remainder=True)
 
     return dataset.map(normalisation_fn, tf.data.AUTOTUNE).prefetch(tf.data.AUTOTUNE)
 
@@ -1,6 +1,7 @@
 """Module for downloading datasets."""
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import keras
@@ -24,13 +25,21 @@ def get_cifar10(save_dir: Path) -> None:
     save_dir.mkdir(exist_ok=True, parents=True)
 
     (x_train, y_train), (x_test, y_test) = keras.datasets.cifar10.load_data()
-    np.savez(
-        save_dir / f"{Datasets.CIFAR10}.npz",
-        x_train=x_train,
-        y_train=y_train,
-        x_test=x_test,
-        y_test=y_test,
-    )
+    arrays = {
+        "x_train": x_train,
+        "y_train": y_train,
+        "x_test": x_test,
+        "y_test": y_test,
+    }
+
+    # Save as uncompressed .npy files so they can be memory-mapped when loading
+    # (saved in parallel as np.save releases the GIL while writing)
+    def save_array(name: str) -> None:
+        arr = arrays[name].astype(np.uint8, copy=False)
+        np.save(save_dir / f"{name}.npy", arr, allow_pickle=False)
+
+    with ThreadPoolExecutor(max_workers=len(arrays)) as executor:
+        list(executor.map(save_array, arrays))
 
     # Warn user that CIFAR-10 is also saved to .keras cache directory
     logger.info("CIFAR10 dataset saved to: %s", save_dir.resolve())
@@ -75,13 +75,16 @@ class BaseGAN(tf.keras.Model, metaclass=GANMetaclass):
         # Get gradients from discriminator predictions and update weights
         with tf.GradientTape() as tape:
             fake_images = self.generator(latent_noise, training=True)
-            pred = self.discriminator(fake_images, training=True)
+            pred = tf.cast(self.discriminator(fake_images, training=True), tf.float32)
             loss = self._loss(real=None, fake=pred)
 
-        grads = tape.gradient(loss, self.generator.trainable_variables)
-        self._g_optimiser.apply_gradients(
-            zip(grads, self.generator.trainable_variables),
-        )
+            # Loss scaling is a no-op unless using float16 mixed precision
+            scaled_loss = self._g_optimiser.scale_loss(loss)
+
+        # Apply directly to avoid zipping/unzipping gradients and variables
+        tvars = self.generator.trainable_variables
+        grads = tape.gradient(scaled_loss, tvars)
+        self._g_optimiser.apply(grads, tvars)
 
         # Update metrics
         self._g_metric.update_state(loss)
@@ -94,8 +97,13 @@ class BaseGAN(tf.keras.Model, metaclass=GANMetaclass):
         real_images: tensor of real images
         """
 
-        # Select minibatch of real images and generate fake images
-        real_mb_size = tf.shape(real_images)[0]
+        # Minibatch size is static as incomplete batches are dropped (this may be
+        # larger than the configured batch size, e.g. if n_critic > 1)
+        real_mb_size = real_images.shape[0]
+        if real_mb_size is None:
+            real_mb_size = tf.shape(real_images)[0]
+
+        # Generate fake images
         latent_noise = tf.random.normal(
             (real_mb_size, self._latent_dim),
             dtype="float32",
@@ -107,15 +115,13 @@ class BaseGAN(tf.keras.Model, metaclass=GANMetaclass):
         # Get gradients from discriminator predictions and update weights
         with tf.GradientTape() as tape:
             pred = self.discriminator(input_batch, training=True)
-            loss = self._loss(
-                real=pred[0:real_mb_size, ...],
-                fake=pred[real_mb_size:, ...],
-            )
+            pred_real, pred_fake = tf.split(pred, [real_mb_size, real_mb_size], axis=0)
+            loss = self._loss(real=pred_real, fake=pred_fake)
 
-        grads = tape.gradient(loss, self.discriminator.trainable_variables)
-        self._d_optimiser.apply_gradients(
-            zip(grads, self.discriminator.trainable_variables),
-        )
+        # Fetch variable list once (after forward pass, as layers are built lazily)
+        tvars = self.discriminator.trainable_variables
+        grads = tape.gradient(loss, tvars)
+        self._d_optimiser.apply(grads, tvars)
 
         # Update metrics
         self._d_metric.update_state(loss)
@@ -2,6 +2,7 @@
 
 import abc
 import enum
+import functools
 from typing import Any
 
 import tensorflow as tf
@@ -13,6 +14,7 @@ from generative.common.losses import LossTypes
 logger = get_logger(__file__)
 
 KERNEL = "kernel"
+MIXED_FLOAT16 = "mixed_float16"
 
 
 class WassersteinTypes(str, enum.Enum):
@@ -36,6 +38,9 @@ class GANMetaclass(abc.ABCMeta):
 
     If the 'loss' argument is set to 'wasserstein', the WassersteinMixin
     overrides the discriminator_step method of the GAN class.
+
+    The mixed class is only created once per GAN class and re-used for
+    subsequent instantiations.
     """
 
     def __call__(cls, *args: DictConfig, **kwargs: DictConfig) -> Any:
@@ -44,13 +49,35 @@ class GANMetaclass(abc.ABCMeta):
         except KeyError:
             cfg = args[0]
 
-        if cfg.loss == LossTypes.WASSERSTEIN:
-            cls = type(f"Wasserstein{cls.__name__}", (WassersteinMixin, cls), {})  # type: ignore[assignment]
+        if cfg.loss == LossTypes.WASSERSTEIN and not issubclass(cls, WassersteinMixin):
+            cls = make_wasserstein_cls(cls)
             logger.info("Using %s", WassersteinMixin.__name__)
 
+        elif cfg.loss != LossTypes.WASSERSTEIN and cfg.get("mixed_precision", None):
+            logger.warning(
+                "Mixed precision %s ignored as only used with %s loss",
+                cfg.mixed_precision,
+                LossTypes.WASSERSTEIN,
+            )
+
         return super().__call__(*args, **kwargs)
 
 
+@functools.lru_cache(maxsize=None)
+def make_wasserstein_cls(cls: GANMetaclass) -> GANMetaclass:
+    """Create (and cache) GAN class with WassersteinMixin added.
+
+    Args:
+    ----
+    cls: GAN class
+
+    Returns:
+    -------
+    GAN class with Wasserstein discriminator training step
+    """
+    return GANMetaclass(f"Wasserstein{cls.__name__}", (WassersteinMixin, cls), {})
+
+
 class WeightClipConstraint(tf.keras.constraints.Constraint):
     """Clip weights in original Wasserstein GAN discriminator.
 
@@ -66,8 +93,17 @@ class WeightClipConstraint(tf.keras.constraints.Constraint):
     def __init__(self, clip_value: float) -> None:
         self._clip_value = clip_value
 
+        # Bounds cached as constants to avoid promotion on every call
+        self._min_value = tf.constant(-clip_value, dtype=tf.float32)
+        self._max_value = tf.constant(clip_value, dtype=tf.float32)
+
     def __call__(self, weights: tf.Tensor) -> tf.Tensor:
-        return tf.clip_by_value(weights, -self._clip_value, self._clip_value)
+        # Keras variables cannot be traced directly so pass in as tensor
+        return self._clip(tf.convert_to_tensor(weights))
+
+    @tf.function(jit_compile=True, reduce_retracing=True)
+    def _clip(self, weights: tf.Tensor) -> tf.Tensor:
+        return tf.clip_by_value(weights, self._min_value, self._max_value)
 
     def get_config(self) -> dict[str, float]:
         return {"clip_value": self._clip_value}
@@ -98,8 +134,37 @@ class WassersteinMixin:
     _mb_size: int
 
     def __init__(self, cfg: DictConfig):
+        # Policy is global and must be set before subclass builds layers, layers fix
+        # their policy on construction so previous policy is restored afterwards
+        mixed_precision = cfg.get("mixed_precision", None)
+        prev_policy = tf.keras.mixed_precision.global_policy()
+        if mixed_precision is not None:
+            tf.keras.mixed_precision.set_global_policy(mixed_precision)
+            logger.info("Using mixed precision: %s", mixed_precision)
+
+        try:
+            self._build_wasserstein(cfg)
+        finally:
+            tf.keras.mixed_precision.set_global_policy(prev_policy)
+
+        self._mixed_precision = mixed_precision
+
+    def _build_wasserstein(self, cfg: DictConfig) -> None:
+        """Build GAN and Wasserstein components using the current global policy.
+
+        Args:
+        ----
+        cfg: config
+        """
         super().__init__(cfg)  # type: ignore[call-arg]
         self._n_critic = cfg.n_critic
+
+        # Explicit generator state allows critic noise to be fused and reproducible,
+        # if no seed given then derive from global seed (e.g. tf.random.set_seed)
+        seed = cfg.get("seed", None)
+        if seed is None:
+            seed = int(tf.random.uniform([], maxval=tf.int64.max, dtype=tf.int64))
+        self._rng = tf.random.Generator.from_seed(seed)
         self._gradient_penalty_coeff = None
 
         if cfg.wasserstein_type == WassersteinTypes.CLIP_WEIGHTS:
@@ -114,6 +179,23 @@ class WassersteinMixin:
             self._gradient_penalty_coeff = cfg.gradient_penalty
             logger.info("Using gradient penalty: %s", cfg.gradient_penalty)
 
+    def compile(self, cfg: DictConfig) -> None:
+        """Compile Keras model, adding loss scaling if using float16.
+
+        Args:
+        ----
+        cfg: configuration object
+        """
+        super().compile(cfg)  # type: ignore[misc]
+
+        if self._mixed_precision == MIXED_FLOAT16:
+            self._d_optimiser = tf.keras.mixed_precision.LossScaleOptimizer(
+                self._d_optimiser,
+            )
+            self._g_optimiser = tf.keras.mixed_precision.LossScaleOptimizer(
+                self._g_optimiser,
+            )
+
     def discriminator_step(self, real_images: tf.Tensor) -> None:
         """WGAN/WGAN-GP Discriminator training step.
 
@@ -122,51 +204,80 @@ class WassersteinMixin:
         real_images: tensor of real images
         """
 
-        # Critic training loop
-        for idx in range(self._n_critic):
-            # Select minibatch of real images and generate fake images
-            real_batch = real_images[
-                idx * self._mb_size : (idx + 1) * self._mb_size,
-                :,
-                :,
-                :,
-            ]
-            real_mb_size = tf.shape(real_batch)[0]
-
-            if real_mb_size == 0:
-                continue
-
-            latent_noise = tf.random.normal(
-                (real_mb_size, self._latent_dim),
-                dtype="float32",
-            )
-            fake_images = self.generator(latent_noise, training=True)
-            input_batch = tf.concat([real_batch, fake_images], axis=0)
-
-            # Get gradients from critic predictions and update weights
-            with tf.GradientTape() as tape:
-                pred = self.discriminator(input_batch, training=True)
-                loss = self._loss(
-                    real=pred[0:real_mb_size, ...],
-                    fake=pred[real_mb_size:, ...],
-                )
-
-                # Gradient penalty if indicated
-                if self._gradient_penalty_coeff:
-                    loss += self.apply_gradient_penalty(real_batch, fake_images)
-
-            grads = tape.gradient(loss, self.discriminator.trainable_variables)
-            self._d_optimiser.apply_gradients(
-                zip(grads, self.discriminator.trainable_variables),
+        # Split into [n_critic, mb_size, H, W, C] minibatches of real images
+        real_batches = tf.reshape(
+            real_images,
+            [self._n_critic, self._mb_size] + real_images.shape[1:],
+        )
+
+        # First critic step is outside the loop as it may need to create variables
+        # (lazily built layers and optimiser state) which cannot be done in a while loop
+        self._critic_train_step(real_batches[0])
+
+        # Remaining critic steps, converted to a single tf.while_loop when traced
+        for idx in tf.range(1, self._n_critic):
+            self._critic_train_step(real_batches[idx])
+
+    @tf.function(jit_compile=False, reduce_retracing=True)
+    def _critic_train_step(self, real_batch: tf.Tensor) -> None:
+        """Single critic update, traced once and reused for each critic iteration.
+
+        Notes:
+        -----
+        XLA is left off as it can be slower when compiling around a gradient tape.
+        No input signature is given so that the (fixed) minibatch shape is traced
+        statically, allowing the critic input to be allocated with a static shape.
+
+        Args:
+        ----
+        real_batch: minibatch of real images
+        """
+        # Generate fake images
+        latent_noise = self._rng.normal((self._mb_size, self._latent_dim))
+        fake_images = tf.cast(self.generator(latent_noise, training=True), tf.float32)
+
+        # Persistent tape only needed if gradient penalty uses it for input gradients
+        with tf.GradientTape(persistent=bool(self._gradient_penalty_coeff)) as tape:
+            if self._gradient_penalty_coeff:
+                # Calculate random weighting of real and fake images
+                epsilon = self._rng.uniform([self._mb_size, 1, 1, 1], 0.0, 1.0)
+                x_hat = epsilon * real_batch + (1 - epsilon) * fake_images
+                tape.watch(x_hat)
+                images = [real_batch, fake_images, x_hat]
+            else:
+                images = [real_batch, fake_images]
+
+            # Single critic forward pass for real, fake (and interpolated) images
+            input_batch = tf.reshape(
+                tf.stack(images, axis=0),
+                [len(images) * self._mb_size] + real_batch.shape[1:],
             )
+            pred = tf.cast(self.discriminator(input_batch, training=True), tf.float32)
+            preds = tf.split(pred, [self._mb_size] * len(images), axis=0)
+            loss = self._loss(real=preds[0], fake=preds[1])
+
+            # Gradient penalty if indicated
+            if self._gradient_penalty_coeff:
+                loss += self.apply_gradient_penalty(tape, x_hat, preds[0], preds[2])
+
+            # Loss scaling is a no-op unless using float16 mixed precision
+            scaled_loss = self._d_optimiser.scale_loss(loss)
+
+        # Fetch variable list once (after forward pass, as layers are built lazily)
+        tvars = self.discriminator.trainable_variables
+        grads = tape.gradient(scaled_loss, tvars)
+        del tape
+        self._d_optimiser.apply(grads, tvars)
 
-            # Update metrics
-            self._d_metric.update_state(loss)
+        # Update metrics
+        self._d_metric.update_state(loss)
 
     def apply_gradient_penalty(
         self,
-        real_images: tf.Tensor,
-        fake_images: tf.Tensor,
+        tape: tf.GradientTape,
+        x_hat: tf.Tensor,
+        pred_real: tf.Tensor,
+        D_hat: tf.Tensor,
     ) -> tf.Tensor:
         """Apply gradient penalty from WGAN-GP.
 
@@ -175,36 +286,38 @@ class WassersteinMixin:
         Gulrajani et al. Improved training of Wasserstein GANs. NeurIPS, 2017.
         https://arxiv.org/abs/1704.00028
 
+        Must be called inside the context of the persistent critic tape, so
+        that the gradient penalty itself is differentiated w.r.t. the weights.
+
         Args:
         ----
-        real_images: tensor of real images
-        fake_images: tensor of fake images
+        tape: persistent critic tape watching x_hat
+        x_hat: random weighting of real and fake images
+        pred_real: discriminator output from real images
+        D_hat: discriminator output from x_hat
 
         """
-        # Prevents discriminator output from drifting too far from zero (Progressive GAN)
-        drift_term = tf.reduce_mean(tf.square(self.discriminator(real_images)))
-
-        # Calculate random weighting of real and fake images
-        epsilon = tf.random.uniform([tf.shape(fake_images)[0], 1, 1, 1], 0.0, 1.0)
-        x_hat = epsilon * real_images + (1 - epsilon) * fake_images
-
-        # Get discriminator output from real/fake images
-        with tf.GradientTape() as tape:
-            tape.watch(x_hat)
-            D_hat = self.discriminator(x_hat, training=True)
-
         # Calculate gradients of output w.r.t. real/fake images
         gradients = tape.gradient(D_hat, x_hat)
-        grad_penalty = self.calc_gradient_penalty(gradients)
+        penalty = self._gradient_penalty_coeff * self.calc_gradient_penalty(gradients)
 
-        return (
-            self._gradient_penalty_coeff * grad_penalty
-            + self._drift_term_coeff * drift_term
-        )
+        # Prevents discriminator output from drifting too far from zero (Progressive GAN)
+        # Coefficient is fixed at init, so this is pruned from the graph if unused
+        if self._drift_term_coeff:
+            drift_term = tf.reduce_mean(tf.square(pred_real))
+            penalty += self._drift_term_coeff * drift_term
+
+        return penalty
 
     def calc_gradient_penalty(self, gradients: tf.Tensor) -> tf.Tensor:
-        grad_norm = tf.sqrt(tf.reduce_sum(tf.square(gradients), axis=[1, 2, 3]) + 1e-8)
-        grad_penalty = tf.reduce_mean(tf.square(grad_norm - 1))
+        # Norm is kept in float32 as values near 1 are sensitive to float16 underflow
+        gradients = tf.cast(gradients, tf.float32)
+
+        # Flatten to one reduction axis (batch size kept static under trace),
+        # epsilon avoids NaN gradient at zero norm
+        gradients = tf.reshape(gradients, [gradients.shape[0], -1])
+        grad_norm = tf.sqrt(tf.reduce_sum(tf.square(gradients), axis=1) + 1e-8)
+        grad_penalty = tf.reduce_mean(tf.math.squared_difference(grad_norm, 1.0))
 
         return grad_penalty
 
@@ -6,21 +6,40 @@ from typing import Any
 
 import matplotlib.image as plt
 import numpy as np
+import numpy.typing as npt
 
 TEST_IMG_DIMS_3D = [8, 4, 4]
 TEST_IMG_DIMS_4D = [8, 4, 4, 3]
 
 
 @pytest.fixture(scope="session", params=[TEST_IMG_DIMS_3D, TEST_IMG_DIMS_4D])
-def create_test_dataset_file(tmp_path_factory: pytest.TempPathFactory, request: Any) -> Path:
-    """Create a test dataset for both black and white and RGB images."""
+def create_test_dataset_file(
+    tmp_path_factory: pytest.TempPathFactory,
+    request: Any,
+) -> tuple[Path, npt.NDArray[np.uint8]]:
+    """Create a test dataset for both black and white and RGB images.
+
+    Returns the file path and the array, so that tests not testing file
+    loading can re-use the array without reading the file.
+    """
     tmp_dir = tmp_path_factory.mktemp("dataset_file")
     save_dir = tmp_dir / "dataset.npz"
-    dataset = np.zeros(request.param)
+    dataset = np.zeros(request.param, dtype="uint8")
     dataset[:, 0, 0] = 255
     np.savez(save_dir, x_train=dataset)
 
-    return save_dir
+    return save_dir, dataset
+
+
+@pytest.fixture(scope="session", params=[TEST_IMG_DIMS_3D, TEST_IMG_DIMS_4D])
+def create_test_dataset_npy(tmp_path_factory: pytest.TempPathFactory, request: Any) -> Path:
+    """Create a test dataset of .npy files for both black and white and RGB images."""
+    tmp_dir = tmp_path_factory.mktemp("dataset_npy")
+    dataset = np.zeros(request.param, dtype="uint8")
+    dataset[:, 0, 0] = 255
+    np.save(tmp_dir / "x_train.npy", dataset)
+
+    return tmp_dir
 
 
 @pytest.fixture(scope="session", params=[TEST_IMG_DIMS_3D, TEST_IMG_DIMS_4D])
@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 
 import numpy as np
+import numpy.typing as npt
 from omegaconf import DictConfig
 import tensorflow as tf
 
@@ -51,9 +52,10 @@ def test_add_channel_dim_fail(data_dims: list[int]) -> None:
 )
 def test_normalise(normalisation: str, expected_min_max: list[float]) -> None:
     """Test normalisation."""
-    dataset = np.repeat(np.reshape(np.arange(0, 256), [4, 8, 8, 1]), 3, axis=3)
+    dataset = np.repeat(np.reshape(np.arange(0, 256, dtype=np.uint8), [4, 8, 8, 1]), 3, axis=3)
     dataset = normalise(normalisation, dataset)
 
+    assert dataset.dtype == np.float32
     assert np.isclose(dataset.min(), expected_min_max[0])
     assert np.isclose(dataset.max(), expected_min_max[1])
 
@@ -94,23 +96,24 @@ def test_resize_dataset_fail(expected_dims: list[int]) -> None:
     ],
 )
 def test_get_dataset_from_file(
-    create_test_dataset_file: Path,
+    create_test_dataset_file: tuple[Path, npt.NDArray[np.uint8]],
     img_dims: list[int],
     normalisation: str,
     batch_size: int,
 ) -> None:
-    """Test loading dataset from file."""
+    """Test creating dataset from already loaded file."""
+    file_path, data_array = create_test_dataset_file
     cfg = DictConfig(
         {
             "img_dims": img_dims,
             "normalisation": normalisation,
-            "data_dir": create_test_dataset_file.parent,
+            "data_dir": file_path.parent,
             "dataset_name": "dataset",
             "batch_size": batch_size,
             "n_critic": 1,
         },
     )
-    dataset = get_dataset_from_file(cfg, DataSplits.TRAIN)
+    dataset = get_dataset_from_file(cfg, DataSplits.TRAIN, data_array=data_array)
     img_batch = next(iter(dataset))
 
     assert img_batch.ndim == 4
@@ -124,6 +127,39 @@ def test_get_dataset_from_file(
     assert tf.reduce_max(img_batch) == 1.0
 
 
+@pytest.mark.parametrize(
+    "normalisation,batch_size",
+    [(Normalisation.ZERO_ONE, 2), (Normalisation.NEG_ONE_ONE, 4)],
+)
+def test_get_dataset_from_npy(
+    create_test_dataset_npy: Path,
+    normalisation: str,
+    batch_size: int,
+) -> None:
+    """Test loading dataset from memory-mapped .npy file."""
+    cfg = DictConfig(
+        {
+            "img_dims": [4, 4],
+            "normalisation": normalisation,
+            "data_dir": create_test_dataset_npy,
+            "dataset_name": "dataset",
+            "batch_size": batch_size,
+            "n_critic": 1,
+        },
+    )
+    dataset = get_dataset_from_file(cfg, DataSplits.TRAIN)
+    img_batch = next(iter(dataset))
+
+    assert img_batch.ndim == 4
+    assert img_batch.shape[0] == batch_size
+
+    if normalisation == Normalisation.NEG_ONE_ONE:
+        assert tf.reduce_min(img_batch) == -1.0
+    else:
+        assert tf.reduce_min(img_batch) == 0.0
+    assert tf.reduce_max(img_batch) == 1.0
+
+
 @pytest.mark.parametrize(
     "img_dims,normalisation,batch_size",
     [
@@ -166,16 +202,17 @@ def test_get_dataset_from_folder(
 
 @pytest.mark.parametrize("batch_size,n_critic",[(1, 1), (2, 1), (1, 2), (2, 2)])
 def test_get_dataset_from_file_ncritic(
-    create_test_dataset_file: Path,
+    create_test_dataset_file: tuple[Path, npt.NDArray[np.uint8]],
     batch_size: int,
     n_critic: int,
 ) -> None:
     """Test loading dataset from file with N_critic * batch size."""
+    file_path, _ = create_test_dataset_file
     cfg = DictConfig(
         {
             "img_dims": [4, 4],
             "normalisation": Normalisation.NEG_ONE_ONE,
-            "data_dir": create_test_dataset_file.parent,
+            "data_dir": file_path.parent,
             "dataset_name": "dataset",
             "batch_size": batch_size,
             "n_critic": n_critic,
@@ -208,3 +245,28 @@ def test_get_dataset_from_folder_ncritic(
     img_batch = next(iter(dataset))
 
     assert img_batch.shape[0] == batch_size * n_critic
+
+
+@pytest.mark.parametrize("batch_size,n_critic",[(3, 1), (1, 3), (3, 2)])
+def test_get_dataset_from_file_drop_remainder(
+    create_test_dataset_file: tuple[Path, npt.NDArray[np.uint8]],
+    batch_size: int,
+    n_critic: int,
+) -> None:
+    """Test incomplete final batch is dropped so critic minibatches are full."""
+    file_path, _ = create_test_dataset_file
+    cfg = DictConfig(
+        {
+            "img_dims": [4, 4],
+            "normalisation": Normalisation.NEG_ONE_ONE,
+            "data_dir": file_path.parent,
+            "dataset_name": "dataset",
+            "batch_size": batch_size,
+            "n_critic": n_critic,
+        },
+    )
+    dataset = get_dataset_from_file(cfg, DataSplits.TRAIN, n_critic)
+
+    assert int(dataset.cardinality()) == 8 // (batch_size * n_critic)
+    for img_batch in dataset:
+        assert img_batch.shape[0] == batch_size * n_critic
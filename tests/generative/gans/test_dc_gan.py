@@ -6,7 +6,8 @@ import numpy as np
 from omegaconf import DictConfig
 import tensorflow as tf
 
-from generative.gans.dc_gan import Discriminator, Generator
+from generative.common.losses import LossTypes
+from generative.gans.dc_gan import DCGAN, Discriminator, Generator
 
 MAX_CHANNELS = 4
 
@@ -79,3 +80,51 @@ def test_generator(mb_size: int, scale_factor: int, img_channels: int, latent_di
     assert generator.channels == channels
     assert np.max(generator.channels) == MAX_CHANNELS
     assert generator.num_downsample == scale_factor
+
+
+@pytest.mark.parametrize(
+    "loss",
+    [LossTypes.BINARY_CROSSENTROPY, LossTypes.ORIGINAL_BINARY_CROSSENTROPY],
+)
+@pytest.mark.parametrize("n_critic", [1, 5])
+def test_train_step(loss: str, n_critic: int) -> None:
+    """Test discriminator and generator training step.
+
+    Non-Wasserstein models still receive batch_size * n_critic images if n_critic > 1.
+    """
+    img_dims = [16, 16, 3]
+    batch_size = 2
+    cfg = DictConfig(
+        {
+            "batch_size": batch_size,
+            "img_dims": img_dims,
+            "latent_dim": 4,
+            "loss": loss,
+            "num_examples": 4,
+            "model_name": "dcgan",
+            "max_channels": 4,
+            "discriminator": {
+                "activation": "leaky_relu",
+                "channels": 1,
+                "dense": False,
+                "opt": "adam",
+                "opt_h_params": {"learning_rate": 2e-4},
+            },
+            "generator": {
+                "activation": "relu",
+                "channels": 1,
+                "dense": False,
+                "output": "tanh",
+                "opt": "adam",
+                "opt_h_params": {"learning_rate": 2e-4},
+            },
+        },
+    )
+    model = DCGAN(cfg)
+    model.compile(cfg)
+    real_images = tf.random.uniform([batch_size * n_critic] + img_dims, -1.0, 1.0)
+    losses = model.train_step(real_images)
+
+    assert np.isfinite(losses["d_loss"].numpy())
+    assert np.isfinite(losses["g_loss"].numpy())
+    assert int(model._d_optimiser.iterations) == 1
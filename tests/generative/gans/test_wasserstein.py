@@ -9,7 +9,11 @@ import tensorflow as tf
 
 from generative.common.losses import LossTypes
 from generative.gans.dc_gan import DCGAN
-from generative.gans.wasserstein import WeightClipConstraint, WassersteinTypes
+from generative.gans.wasserstein import (
+    WassersteinMixin,
+    WassersteinTypes,
+    WeightClipConstraint,
+)
 
 MAX_CHANNELS = 4
 
@@ -224,3 +228,302 @@ def test_wasserstein_gp_fail() -> None:
     # Initialise model and check fails
     with pytest.raises(ConfigAttributeError):
         _ = DCGAN(cfg)
+
+
+@pytest.mark.parametrize(
+    "wasserstein_type,n_critic",
+    [
+        (WassersteinTypes.CLIP_WEIGHTS, 1), (WassersteinTypes.CLIP_WEIGHTS, 3),
+        (WassersteinTypes.GRADIENT_PENALTY, 1), (WassersteinTypes.GRADIENT_PENALTY, 3),
+    ],
+)
+def test_wasserstein_train_step(wasserstein_type: str, n_critic: int) -> None:
+    """Test Wasserstein critic and generator training step."""
+    img_dims = [16, 16, 3]
+    batch_size = 2
+    cfg = DictConfig(
+        {
+            "batch_size": batch_size,
+            "img_dims": img_dims,
+            "latent_dim": 4,
+            "loss": LossTypes.WASSERSTEIN,
+            "num_examples": 4,
+            "model_name": "dcgan",
+            "max_channels": 4,
+            "discriminator": {
+                "activation": "leaky_relu",
+                "channels": 1,
+                "dense": False,
+                "opt": "adam",
+                "opt_h_params": {"learning_rate": 1e-4},
+            },
+            "generator": {
+                "activation": "relu",
+                "channels": 1,
+                "dense": False,
+                "output": "tanh",
+                "opt": "adam",
+                "opt_h_params": {"learning_rate": 1e-4},
+            },
+            "wasserstein_type": wasserstein_type,
+            "n_critic": n_critic,
+            "clip_value": 0.01,
+            "gradient_penalty": 10,
+        },
+    )
+    model = DCGAN(cfg)
+    model.compile(cfg)
+    real_images = tf.random.uniform([batch_size * n_critic] + img_dims, -1.0, 1.0)
+    losses = model.train_step(real_images)
+
+    assert np.isfinite(losses["d_loss"].numpy())
+    assert np.isfinite(losses["g_loss"].numpy())
+
+    # Check critic updated once per critic iteration
+    assert int(model._d_optimiser.iterations) == n_critic
+
+    # Check weights still clipped after update
+    if wasserstein_type == WassersteinTypes.CLIP_WEIGHTS:
+        for variable in model.discriminator.trainable_variables:
+            if variable.ndim > 1:
+                assert np.abs(variable.numpy()).max() <= cfg.clip_value + 1e-6
+
+
+@pytest.mark.parametrize(
+    "grad_mb_size,grad_value,expected_penalty",
+    [(2, 0.0, 1.0), (2, 0.125, 0.0), (2, 0.25, 1.0), (4, 0.125, 0.0), (1, 0.25, 1.0)],
+)
+def test_calc_gradient_penalty(
+    grad_mb_size: int,
+    grad_value: float,
+    expected_penalty: float,
+) -> None:
+    """Test gradient penalty is (||grad||_2 - 1)^2 averaged over minibatch."""
+    img_dims = [8, 8, 1]
+    cfg = DictConfig(
+        {
+            "batch_size": 2,
+            "img_dims": img_dims,
+            "latent_dim": 4,
+            "loss": LossTypes.WASSERSTEIN,
+            "num_examples": 4,
+            "model_name": "dcgan",
+            "max_channels": 4,
+            "discriminator": {
+                "activation": "leaky_relu",
+                "channels": 1,
+                "dense": False,
+            },
+            "generator": {
+                "activation": "relu",
+                "channels": 1,
+                "dense": False,
+                "output": "linear",
+            },
+            "wasserstein_type": WassersteinTypes.GRADIENT_PENALTY,
+            "n_critic": 1,
+            "gradient_penalty": 10,
+        },
+    )
+    model = DCGAN(cfg)
+
+    # 64 elements per image, so norm is 8 * grad_value
+    gradients = tf.fill([grad_mb_size] + img_dims, grad_value)
+    penalty = model.calc_gradient_penalty(gradients)
+
+    assert np.isclose(penalty.numpy(), expected_penalty, atol=1e-3)
+
+
+@pytest.mark.parametrize("mixed_precision", ["mixed_float16", "mixed_bfloat16"])
+def test_wasserstein_mixed_precision(mixed_precision: str) -> None:
+    """Test WGAN-GP training step with mixed precision."""
+    img_dims = [16, 16, 3]
+    batch_size = 2
+    n_critic = 2
+    cfg = DictConfig(
+        {
+            "batch_size": batch_size,
+            "img_dims": img_dims,
+            "latent_dim": 4,
+            "loss": LossTypes.WASSERSTEIN,
+            "num_examples": 4,
+            "model_name": "dcgan",
+            "max_channels": 4,
+            "discriminator": {
+                "activation": "leaky_relu",
+                "channels": 1,
+                "dense": False,
+                "opt": "adam",
+                "opt_h_params": {"learning_rate": 1e-4},
+            },
+            "generator": {
+                "activation": "relu",
+                "channels": 1,
+                "dense": False,
+                "output": "tanh",
+                "opt": "adam",
+                "opt_h_params": {"learning_rate": 1e-4},
+            },
+            "wasserstein_type": WassersteinTypes.GRADIENT_PENALTY,
+            "n_critic": n_critic,
+            "gradient_penalty": 10,
+            "mixed_precision": mixed_precision,
+        },
+    )
+
+    model = DCGAN(cfg)
+    model.compile(cfg)
+    real_images = tf.random.uniform([batch_size * n_critic] + img_dims, -1.0, 1.0)
+    losses = model.train_step(real_images)
+
+    assert np.isfinite(losses["d_loss"].numpy())
+    assert np.isfinite(losses["g_loss"].numpy())
+
+    # Check layers use mixed precision but global policy is restored
+    assert model.generator(tf.zeros([1, 4])).dtype == mixed_precision.split("_")[1]
+    assert tf.keras.mixed_precision.global_policy().name == "float32"
+
+    # Check loss scaling only used for float16
+    is_loss_scaled = isinstance(
+        model._d_optimiser,
+        tf.keras.mixed_precision.LossScaleOptimizer,
+    )
+    assert is_loss_scaled == (mixed_precision == "mixed_float16")
+
+    # Check variables still stored in float32
+    for variable in model.discriminator.trainable_variables:
+        assert variable.dtype == "float32"
+
+
+def test_wasserstein_mixed_precision_restored() -> None:
+    """Test mixed precision does not leak into models built afterwards."""
+    img_dims = [16, 16, 3]
+    batch_size = 2
+    cfg = {
+        "batch_size": batch_size,
+        "img_dims": img_dims,
+        "latent_dim": 4,
+        "loss": LossTypes.WASSERSTEIN,
+        "num_examples": 4,
+        "model_name": "dcgan",
+        "max_channels": 4,
+        "discriminator": {
+            "activation": "leaky_relu",
+            "channels": 1,
+            "dense": False,
+            "opt": "adam",
+            "opt_h_params": {"learning_rate": 1e-4},
+        },
+        "generator": {
+            "activation": "relu",
+            "channels": 1,
+            "dense": False,
+            "output": "tanh",
+            "opt": "adam",
+            "opt_h_params": {"learning_rate": 1e-4},
+        },
+        "wasserstein_type": WassersteinTypes.GRADIENT_PENALTY,
+        "n_critic": 1,
+        "gradient_penalty": 10,
+    }
+    _ = DCGAN(DictConfig({**cfg, "mixed_precision": "mixed_float16"}))
+
+    # Check subsequent Wasserstein and non-Wasserstein models use float32
+    for model_cfg in [
+        DictConfig({**cfg, "mixed_precision": None}),
+        DictConfig({**cfg, "loss": LossTypes.BINARY_CROSSENTROPY}),
+    ]:
+        model = DCGAN(model_cfg)
+        model.compile(model_cfg)
+        losses = model.train_step(tf.zeros([batch_size] + img_dims))
+
+        assert model.generator(tf.zeros([1, 4])).dtype == "float32"
+        assert np.isfinite(losses["d_loss"].numpy())
+
+
+def test_wasserstein_class_cached() -> None:
+    """Test Wasserstein GAN class is only created once per GAN class."""
+    cfg = DictConfig(
+        {
+            "batch_size": 2,
+            "img_dims": [32, 32, 3],
+            "latent_dim": 4,
+            "loss": LossTypes.WASSERSTEIN,
+            "num_examples": 4,
+            "model_name": "dcgan",
+            "max_channels": 4,
+            "discriminator": {
+                "activation": "leaky_relu",
+                "channels": 1,
+                "dense": False,
+            },
+            "generator": {
+                "activation": "relu",
+                "channels": 1,
+                "dense": False,
+                "output": "linear",
+            },
+            "wasserstein_type": WassersteinTypes.GRADIENT_PENALTY,
+            "n_critic": 5,
+            "gradient_penalty": 10,
+        },
+    )
+    model_1 = DCGAN(cfg)
+    model_2 = DCGAN(cfg)
+
+    assert type(model_1) is type(model_2)
+    assert isinstance(model_1, WassersteinMixin)
+    assert isinstance(model_1, DCGAN)
+
+    # Check instantiating mixed class directly does not add mixin again
+    model_3 = type(model_1)(cfg)
+    assert type(model_3) is type(model_1)
+
+
+@pytest.mark.parametrize("seed", [5, None])
+def test_wasserstein_seed(seed: int | None) -> None:
+    """Test critic training is reproducible with config seed or global seed."""
+    img_dims = [16, 16, 3]
+    batch_size = 2
+    n_critic = 2
+    cfg = DictConfig(
+        {
+            "batch_size": batch_size,
+            "img_dims": img_dims,
+            "latent_dim": 4,
+            "loss": LossTypes.WASSERSTEIN,
+            "num_examples": 4,
+            "model_name": "dcgan",
+            "max_channels": 4,
+            "discriminator": {
+                "activation": "leaky_relu",
+                "channels": 1,
+                "dense": False,
+                "opt": "adam",
+                "opt_h_params": {"learning_rate": 1e-4},
+            },
+            "generator": {
+                "activation": "relu",
+                "channels": 1,
+                "dense": False,
+                "output": "tanh",
+                "opt": "adam",
+                "opt_h_params": {"learning_rate": 1e-4},
+            },
+            "wasserstein_type": WassersteinTypes.GRADIENT_PENALTY,
+            "n_critic": n_critic,
+            "gradient_penalty": 10,
+            "seed": seed,
+        },
+    )
+    real_images = tf.random.uniform([batch_size * n_critic] + img_dims, -1.0, 1.0)
+    d_losses = []
+
+    # Global seed also needed for identical weight initialisation
+    for _ in range(2):
+        tf.keras.utils.set_random_seed(0)
+        model = DCGAN(cfg)
+        model.compile(cfg)
+        d_losses.append(model.train_step(real_images)["d_loss"].numpy())
+
+    assert np.isclose(d_losses[0], d_losses[1])